@@ -1,17 +1,39 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import plotly.express as px
+import plotly.graph_objects as go
 import datetime
+import glob
+import hashlib
+import json
 import os
+import tempfile
+import time
+import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+# Copy-on-Write lets filtered frames be modified without defensive .copy() calls
+# (always on from pandas 3.0, where the option is deprecated)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
 # Page config
 st.set_page_config(page_title="서울 부동산 실거래가 실시간 분석", layout="wide")
 
 # Paths and Env
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Upper bound on points per line trace (roughly the chart's pixel width)
+MAX_TREND_POINTS = 800
+# Switch line charts to WebGL once they carry more points than SVG handles smoothly
+WEBGL_POINT_THRESHOLD = 1000
+
 # API Key Loading (Streamlit Cloud Secrets priority, then local .env)
 # In Streamlit Cloud, set SEOUL_API_KEY in "Advanced settings -> Secrets"
 if "SEOUL_API_KEY" in st.secrets:
@@ -30,6 +52,24 @@ else:
             break
     API_KEY = os.getenv("SEOUL_API_KEY")
 
+# Live API rows are also kept on disk so a process restart within the TTL skips the fetch
+API_CACHE_TTL = 3600
+API_CACHE_PREFIX = os.path.join(BASE_DIR, "data", "seoul_real_estate_2026_api")
+
+def api_cache_path(api_key, max_pages):
+    # Results differ per key and page count; hash the key so it never lands on disk in clear
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:12]
+    return f"{API_CACHE_PREFIX}_{key_hash}_p{max_pages}.parquet"
+
+# Known column types, so CSV parsing doesn't have to infer them.
+# These are also the only columns the dashboard reads, so nothing else is parsed.
+CSV_DTYPES = {
+    # THING_AMT is read as text: exports sometimes carry values like "56,000", which
+    # preprocess_data coerces to NaN instead of failing the whole load
+    'CTRT_DAY': 'string[pyarrow]', 'THING_AMT': 'string[pyarrow]', 'ARCH_AREA': 'float64[pyarrow]',
+    'BLDG_NM': 'string[pyarrow]', 'FLR': 'float64[pyarrow]'
+}
+
 # Custom CSS for premium look
 st.markdown("""
     <style>
@@ -55,31 +95,124 @@ st.markdown("""
     </style>
     """, unsafe_allow_html=True)
 
-@st.cache_data(ttl=3600)
+@st.cache_data(ttl=API_CACHE_TTL)
 def fetch_2026_api_data(api_key, max_pages=5):
     if not api_key:
         return pd.DataFrame()
+    cache_path = api_cache_path(api_key, max_pages)
+    # A disk hit is memoized for another full TTL, so rows can be up to ~2x API_CACHE_TTL
+    # old before the next live fetch; the sidebar refresh button forces one immediately.
+    if os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < API_CACHE_TTL:
+        df = read_parquet_or_none(cache_path)
+        if df is not None:
+            return df
+        # Unreadable cache: drop it and fetch live
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
     service_name = "tbLnOpendataRtmsV"
     all_rows = []
     
     # Only fetch 2026 data live
+    urls = []
     for page in range(max_pages):
         start_idx = (page * 1000) + 1
         end_idx = start_idx + 999
-        url = f"http://openapi.seoul.go.kr:8088/{api_key}/json/{service_name}/{start_idx}/{end_idx}/2026"
+        urls.append(f"http://openapi.seoul.go.kr:8088/{api_key}/json/{service_name}/{start_idx}/{end_idx}/2026")
+
+    # Request every page at once over a shared keep-alive session
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=max_pages, pool_maxsize=max_pages)
+        session.mount("http://", adapter)
+
+        def fetch(url):
+            try:
+                return session.get(url, timeout=10)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_pages) as executor:
+            responses = list(executor.map(fetch, urls))
+
+    # Pages ran in parallel, so apply the stop conditions afterwards, in page order
+    for response in responses:
+        if response is None or response.status_code != 200: break
         try:
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                if service_name in data:
-                    rows = data[service_name]['row']
-                    all_rows.extend(rows)
-                    if len(rows) < 1000: break
-                else: break
-            else: break
-        except Exception: break
+            data = response.json()
+        except ValueError: break
+        if service_name not in data: break
+        rows = data[service_name]['row']
+        all_rows.extend(rows)
+        if len(rows) < 1000: break
             
-    return pd.DataFrame(all_rows)
+    # Convert the row dicts in one columnar pass instead of per-row inference.
+    # A struct array takes the union of keys across rows, like pd.DataFrame(all_rows);
+    # Table.from_pylist would keep only the first row's keys.
+    try:
+        if not all_rows:
+            df = pd.DataFrame()
+        else:
+            df = pa.Table.from_struct_array(pa.array(all_rows)).to_pandas(types_mapper=pd.ArrowDtype)
+    except pa.ArrowException:
+        # A column mixing types across rows can't form an Arrow array
+        # (ArrowInvalid or ArrowTypeError depending on which type comes first)
+        df = pd.DataFrame(all_rows)
+
+    # Don't persist an empty result from a failed fetch
+    if not df.empty:
+        try:
+            write_parquet_atomic(df, cache_path)
+        except (OSError, pa.ArrowException):
+            pass  # Read-only deployments or mixed-type columns just skip the disk cache
+    return df
+
+def write_parquet_atomic(df, path, cache_key=None, **kwargs):
+    # Write next to the target and swap it in, so a killed process never leaves a truncated file
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if cache_key is not None:
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), b'cache_key': cache_key.encode()})
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp_path, **kwargs)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def read_parquet_or_none(path, cache_key=None, **kwargs):
+    # A missing, unreadable or mismatched cache file just means "no cache"
+    try:
+        if cache_key is not None and (pq.read_schema(path).metadata or {}).get(b'cache_key') != cache_key.encode():
+            return None
+        return pd.read_parquet(path, **kwargs)
+    except (OSError, pa.ArrowException):
+        return None
+
+def read_real_estate_csv(path):
+    # Reuse a Parquet copy of the CSV only if it was built from this exact file with the current dtypes
+    parquet_path = os.path.join(BASE_DIR, "data", os.path.splitext(os.path.basename(path))[0] + ".parquet")
+    stat = os.stat(path)
+    cache_key = json.dumps({'dtypes': CSV_DTYPES, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}, sort_keys=True)
+    df = read_parquet_or_none(parquet_path, cache_key=cache_key)
+    if df is not None:
+        return df
+
+    try:
+        df = pd.read_csv(path, encoding='utf-8', engine='pyarrow', dtype_backend='pyarrow',
+                         usecols=list(CSV_DTYPES), dtype=CSV_DTYPES)
+    except UnicodeDecodeError:
+        # pyarrow can't decode cp949, so fall back to the default C engine
+        df = pd.read_csv(path, encoding='cp949', dtype_backend='pyarrow',
+                         usecols=list(CSV_DTYPES), dtype=CSV_DTYPES)
+
+    try:
+        write_parquet_atomic(df, parquet_path, cache_key=cache_key, compression='zstd')
+    except OSError:
+        pass  # Read-only deployments just keep parsing the CSV
+    return df
 
 @st.cache_data
 def load_2025_csv():
@@ -102,10 +235,7 @@ def load_2025_csv():
             break
             
     if found_path:
-        try:
-            return pd.read_csv(found_path, encoding='utf-8')
-        except:
-            return pd.read_csv(found_path, encoding='cp949')
+        return read_real_estate_csv(found_path)
     
     st.error(f"⚠️ 데이터를 찾을 수 없습니다. (파일명: {filename})")
     st.info(f"현재 위치({os.getcwd()})와 그 하위 폴더를 확인해 주세요.")
@@ -122,24 +252,70 @@ def load_local_data():
         
     dfs = [df25]
     if os.path.exists(file_path_26):
-        try:
-            df26 = pd.read_csv(file_path_26, encoding='utf-8')
-            dfs.append(df26)
-        except:
-            df26 = pd.read_csv(file_path_26, encoding='cp949')
-            dfs.append(df26)
+        dfs.append(read_real_estate_csv(file_path_26))
             
     return pd.concat(dfs, ignore_index=True)
 
+def frame_cache_key(df):
+    # Hashing a whole DataFrame is slow; row count + latest contract date identifies a load,
+    # and a vectorized hash of date/price catches refetches that swap rows at the same size
+    if df.empty: return (0, None, 0)
+    dates = df['CTRT_DAY']
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        # Raw frames may mix int and str dates across sources, so compare as strings
+        dates = dates.astype(str)
+    fingerprint = int(pd.util.hash_pandas_object(df[['CTRT_DAY', 'THING_AMT']], index=False).sum())
+    return (len(df), str(dates.max()), fingerprint)
+
+@st.cache_data(ttl=API_CACHE_TTL, show_spinner=False, hash_funcs={pd.DataFrame: frame_cache_key})
 def preprocess_data(df):
     if df.empty: return df
+    # Apply the 2025 cutoff on the raw YYYYMMDD strings so only surviving rows get parsed
+    df = df.loc[df['CTRT_DAY'].astype(str).str.slice(0, 8) >= '20250101']
     df['CTRT_DAY'] = pd.to_datetime(df['CTRT_DAY'], format='%Y%m%d', errors='coerce')
     df = df.dropna(subset=['CTRT_DAY'])
-    df = df[df['CTRT_DAY'] >= '2025-01-01']
-    df['THING_AMT'] = pd.to_numeric(df['THING_AMT'], errors='coerce')
+    # dtype_backend keeps the numbers Arrow-backed even when API rows arrive as strings
+    df['THING_AMT'] = pd.to_numeric(df['THING_AMT'], errors='coerce', dtype_backend='pyarrow')
     df['THING_AMT'] = df['THING_AMT'] / 10000.0
+    df['ARCH_AREA'] = pd.to_numeric(df['ARCH_AREA'], errors='coerce', dtype_backend='pyarrow')
+    # Downcast floors to the smallest integer type; prices/areas stay 64-bit so the
+    # tables and hovers show 35.95 / 49.6 rather than float32 noise like 49.599998
+    df['FLR'] = pd.to_numeric(df['FLR'], errors='coerce', downcast='integer', dtype_backend='pyarrow')
+    # Mixed-source (API) columns may still be object/str; move them onto Arrow as well
+    obj_cols = df.select_dtypes(include=['object', 'string']).columns
+    df[obj_cols] = df[obj_cols].convert_dtypes(dtype_backend='pyarrow')
+    # Apartment names repeat heavily, so categories save memory and speed up str/groupby ops
+    df['BLDG_NM'] = df['BLDG_NM'].astype('category')
     return df
 
+def lttb_indices(y, n_out):
+    # Largest-Triangle-Three-Buckets: pick the n_out points that best preserve the line shape
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    idx = np.empty(n_out, dtype=int)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        nxt_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[end:nxt_end].mean(), y[end:nxt_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        idx[i + 1] = a
+    return idx
+
+def downsample_lttb(df, y_col, by=None, n_out=MAX_TREND_POINTS):
+    # Keep at most n_out rows per group so rendering cost doesn't grow with the data
+    y = df[y_col].to_numpy(dtype=float)
+    groups = df.groupby(by, sort=False, observed=True).indices.values() if by else [np.arange(len(df))]
+    keep = np.zeros(len(df), dtype=bool)
+    for pos in groups:
+        keep[pos[lttb_indices(y[pos], n_out)]] = True
+    return df[keep]
+
 # Sidebar for Setup
 st.sidebar.title("🛠️ 데이터 옵션")
 option = st.sidebar.radio("데이터 모드", ["로컬 (25'CSV) + 실시간 (26'API)", "전체 로컬 모드"])
@@ -147,6 +323,12 @@ option = st.sidebar.radio("데이터 모드", ["로컬 (25'CSV) + 실시간 (26'
 refresh = st.sidebar.button("🔄 데이터 새로고침")
 if refresh:
     st.cache_data.clear()
+    # Force a live API fetch too, not just an in-memory cache reset
+    for p in glob.glob(f"{API_CACHE_PREFIX}_*.parquet"):
+        try:
+            os.remove(p)
+        except OSError:
+            pass  # Already removed by a concurrent refresh, or not deletable
 
 if option == "로컬 (25'CSV) + 실시간 (26'API)":
     with st.spinner("2025년 데이터 로드 중..."):
@@ -181,32 +363,30 @@ mega_complexes_keywords = [
     '헬리오시티', '파크리오', '잠실엘스', '리센츠', '고덕그라시움', 
     '고덕아르테온', '올림픽선수기자촌', '센트라스', '마포래미안푸르지오', '올림픽파크포레온'
 ]
+MEGA_PATTERN = re.compile(f"({'|'.join(map(re.escape, mega_complexes_keywords))})")
 
-def get_filtered_mega_data(df, keywords):
-    pattern = '|'.join(keywords)
-    m_df = df[df['BLDG_NM'].str.contains(pattern, na=False)].copy()
-    
-    def get_group_name(name):
-        for k in keywords:
-            if k in name: return k
-        return name
-    
-    m_df['GROUP_NM'] = m_df['BLDG_NM'].apply(get_group_name)
+@st.cache_data(ttl=API_CACHE_TTL, show_spinner=False, hash_funcs={pd.DataFrame: frame_cache_key})
+def get_filtered_mega_data(df, pattern):
+    # A single extract both finds the matching rows and names their group
+    group_nm = df['BLDG_NM'].str.extract(pattern, expand=False)
+    matched = group_nm.notna()
+    m_df = df[matched]
+    m_df['GROUP_NM'] = group_nm[matched].astype('category')
     m_df['AREA_ROUND'] = m_df['ARCH_AREA'].round(0)
     
-    # Filter each group by its most frequent area (Mode)
-    final_dfs = []
-    for g_name in m_df['GROUP_NM'].unique():
-        group = m_df[m_df['GROUP_NM'] == g_name]
-        main_area = group['AREA_ROUND'].mode()[0]
-        # Keep only records matching the main area (within +/- 2 range for safety)
-        group_filtered = group[group['AREA_ROUND'] == main_area].copy()
-        group_filtered['MAIN_AREA'] = main_area
-        final_dfs.append(group_filtered)
-    
-    return pd.concat(final_dfs, ignore_index=True) if final_dfs else pd.DataFrame()
+    # Filter each group by its most frequent area (Mode) in a single groupby pass
+    main_area = m_df.groupby('GROUP_NM', observed=True)['AREA_ROUND'].transform(lambda s: s.mode().iat[0])
+    # Keep only records matching the main area
+    return m_df.loc[m_df['AREA_ROUND'] == main_area].assign(MAIN_AREA=main_area)
 
-mega_filtered = get_filtered_mega_data(df, mega_complexes_keywords)
+mega_filtered = get_filtered_mega_data(df, MEGA_PATTERN)
+
+@st.cache_data(ttl=API_CACHE_TTL, show_spinner=False, hash_funcs={pd.DataFrame: frame_cache_key})
+def get_taegang(df):
+    t = df[df['BLDG_NM'].str.contains('태강', regex=False, na=False)]
+    # Use floor to capture 49.x as 49
+    t['AREA_INT'] = t['ARCH_AREA'].astype('int16')
+    return t
 
 with tab1:
     st.header("서울 10대 대단지 주력 평형 분석")
@@ -228,17 +408,22 @@ with tab1:
 
         with col2:
             st.subheader("📈 주력 평형 평균 가격 추이")
-            mega_filtered['YEAR_MONTH'] = mega_filtered['CTRT_DAY'].dt.to_period('M').astype(str)
-            m_trend = mega_filtered.groupby(['YEAR_MONTH', 'GROUP_NM'])['THING_AMT'].mean().reset_index()
+            # Group on an int YYYYMM key and only format it as 'YYYY-MM' for the axis
+            mega_filtered['YEAR_MONTH'] = (mega_filtered['CTRT_DAY'].dt.year * 100 + mega_filtered['CTRT_DAY'].dt.month).astype('int32')
+            m_trend = mega_filtered.groupby(['YEAR_MONTH', 'GROUP_NM'], observed=True)['THING_AMT'].mean().reset_index()
+            m_trend['YEAR_MONTH'] = m_trend['YEAR_MONTH'].astype(str).str.replace(r'(\d{4})(\d{2})', r'\1-\2', regex=True)
+            # Guard for future data volume: monthly traces are far below MAX_TREND_POINTS today
+            m_trend = downsample_lttb(m_trend, 'THING_AMT', by='GROUP_NM')
             
             fig = px.line(m_trend, x='YEAR_MONTH', y='THING_AMT', color='GROUP_NM',
                          labels={'THING_AMT': '평균 거래금액(억)', 'YEAR_MONTH': '계약년월'},
-                         title="단지별 대표 평형 가격 변동", markers=True)
+                         title="단지별 대표 평형 가격 변동", markers=True,
+                         render_mode='webgl' if len(m_trend) > WEBGL_POINT_THRESHOLD else 'auto')
             st.plotly_chart(fig, use_container_width=True)
 
         st.markdown("---")
         st.subheader("🏢 단지별 대표 평형 요약")
-        m_stats = mega_filtered.groupby(['GROUP_NM', 'MAIN_AREA']).agg({
+        m_stats = mega_filtered.groupby(['GROUP_NM', 'MAIN_AREA'], observed=True).agg({
             'THING_AMT': ['count', 'mean', 'max', 'min']
         }).reset_index()
         m_stats.columns = ['단지명', '대표평형(㎡)', '거래건수', '평균가(억)', '최고가(억)', '최소가(억)']
@@ -256,16 +441,15 @@ with tab2:
     # Let's use int() or floor() so 49.6 -> 49
     target_area = 49 if "49" in area_choice else 59
     
-    taegang_df = df[df['BLDG_NM'].str.contains('태강', na=False)].copy()
-    # Use floor to capture 49.x as 49
-    taegang_df['AREA_INT'] = taegang_df['ARCH_AREA'].astype(int)
-    taegang_filtered = taegang_df[taegang_df['AREA_INT'] == target_area].copy()
+    # Only the cheap area filter runs on toggle; the name scan is cached
+    taegang_df = get_taegang(df)
+    taegang_filtered = taegang_df[taegang_df['AREA_INT'] == target_area]
     
     if taegang_filtered.empty:
         st.warning(f"{target_area}㎡ 타입의 거래 내역이 선택된 데이터 범위 내에 없습니다.")
         # Fallback check: maybe it rounds higher?
         alt_area = 50 if target_area == 49 else 60
-        alt_filtered = taegang_df[taegang_df['AREA_INT'] == alt_area].copy()
+        alt_filtered = taegang_df[taegang_df['AREA_INT'] == alt_area]
         if not alt_filtered.empty:
             st.info(f"참고: {target_area}㎡ 대신 {alt_area}㎡(실제 {alt_filtered['ARCH_AREA'].iloc[0]}㎡) 데이터를 표시합니다.")
             taegang_filtered = alt_filtered
@@ -283,25 +467,40 @@ with tab2:
             
         with colB:
             st.subheader("📈 거래가격 추세")
-            taegang_filtered['YEAR_MONTH'] = taegang_filtered['CTRT_DAY'].dt.to_period('M').astype(str)
-            t_monthly = taegang_filtered.groupby('YEAR_MONTH')['THING_AMT'].mean().reset_index()
+            taegang_filtered['YEAR_MONTH'] = (taegang_filtered['CTRT_DAY'].dt.year * 100 + taegang_filtered['CTRT_DAY'].dt.month).astype('int32')
+            t_monthly = taegang_filtered.groupby('YEAR_MONTH')['THING_AMT'].agg(
+                THING_AMT='mean', MIN_AMT='min', MAX_AMT='max').reset_index()
             t_monthly = t_monthly.sort_values('YEAR_MONTH')
+            t_monthly['YEAR_MONTH'] = t_monthly['YEAR_MONTH'].astype(str).str.replace(r'(\d{4})(\d{2})', r'\1-\2', regex=True)
+            # Guard for future data volume: monthly traces are far below MAX_TREND_POINTS today
+            t_monthly = downsample_lttb(t_monthly, 'THING_AMT')
             
-            # Main Line Chart
-            fig_t = px.line(t_monthly, x='YEAR_MONTH', y='THING_AMT', 
-                          title=f"태강 {target_area}㎡ 월별 평균가 추이",
-                          markers=True,
-                          color_discrete_sequence=['#4A90E2'])
+            # Main Chart: min~max band per month with the mean line on top
+            Scatter = go.Scattergl if len(t_monthly) > WEBGL_POINT_THRESHOLD else go.Scatter
+            fig_t = go.Figure([
+                Scatter(x=t_monthly['YEAR_MONTH'], y=t_monthly['MAX_AMT'], name='최고가',
+                        mode='lines', line=dict(width=0), showlegend=False),
+                Scatter(x=t_monthly['YEAR_MONTH'], y=t_monthly['MIN_AMT'], name='최저가~최고가',
+                        mode='lines', line=dict(width=0), fill='tonexty',
+                        fillcolor='rgba(74, 144, 226, 0.2)'),
+                Scatter(x=t_monthly['YEAR_MONTH'], y=t_monthly['THING_AMT'], name='월평균가',
+                        mode='lines+markers', line=dict(color='#4A90E2'))
+            ])
+            fig_t.update_layout(title=f"태강 {target_area}㎡ 월별 가격 범위 및 평균가 추이",
+                                xaxis_title='계약년월', yaxis_title='거래금액(억)')
             
             # Add Trendline (Simple Linear Regression)
             if len(t_monthly) > 1:
-                import numpy as np
-                x = np.arange(len(t_monthly))
-                y = t_monthly['THING_AMT'].values
-                z = np.polyfit(x, y, 1)
-                p = np.poly1d(z)
+                x = np.arange(len(t_monthly), dtype=float)
+                y = t_monthly['THING_AMT'].to_numpy(dtype=float)
+                # Closed-form least squares for a degree-1 fit
+                n = len(x)
+                sx, sy = x.sum(), y.sum()
+                slope = ((x * y).sum() - sx * sy / n) / ((x * x).sum() - sx * sx / n)
+                intercept = (sy - slope * sx) / n
+                trend = intercept + slope * x
                 
-                fig_t.add_scatter(x=t_monthly['YEAR_MONTH'], y=p(x), 
+                fig_t.add_scatter(x=t_monthly['YEAR_MONTH'], y=trend, 
                                  mode='lines', 
                                  name='가격 추세선',
                                  line=dict(color='red', width=2, dash='dot'))
@@ -313,7 +512,8 @@ with tab2:
         fig_scat = px.scatter(taegang_filtered, x='CTRT_DAY', y='THING_AMT', color='FLR',
                                labels={'CTRT_DAY': '계약일', 'THING_AMT': '거래금액(억)', 'FLR': '층'},
                                hover_data=['ARCH_AREA'],
-                               title=f"{target_area}㎡ 거래 상세 분포")
+                               title=f"{target_area}㎡ 거래 상세 분포",
+                               render_mode='webgl')
         st.plotly_chart(fig_scat, use_container_width=True)
 
 st.sidebar.markdown("---")